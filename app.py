@@ -1,17 +1,40 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
+import plotly.io as pio
 from dash import Dash, dcc, html
-from dash.dependencies import Input, Output
+from dash.dependencies import ClientsideFunction, Input, Output, State
 import dash_bootstrap_components as dbc
 
-# Load data
-df = pd.read_csv("https://raw.githubusercontent.com/JoshData/historical-state-population-csv/refs/heads/primary/historical_state_population_by_year.csv", names=['state', 'year', 'population'])
+from data import pop, growth_matrix
 
-# Preprocessing
-df['state'] = df['state'].str.upper()
+# Dropdown options, built once from the (already sorted) pivot axes
+YEARS = pop.index.to_numpy()
+STATES = sorted(pop.columns)
+YEAR_OPTIONS = [{'label': str(year), 'value': int(year)} for year in YEARS]
+STATE_OPTIONS = [{'label': state, 'value': state} for state in STATES]
 
-# Create Dash app with Bootstrap theme
-app = Dash(__name__, external_stylesheets=[dbc.themes.FLATLY])
+# Static trend data for the clientside callback (years without data are null)
+TREND_DATA = {
+    'years': [int(year) for year in YEARS],
+    'population': {state: [None if pd.isna(value) else int(value) for value in pop[state]]
+                   for state in STATES},
+    'layout': go.Figure().update_layout(
+        xaxis_title='Year',
+        yaxis_title='Population',
+        height=600,
+        title_x=0.5
+    ).to_dict()['layout']
+}
+
+# Dash encodes callback responses through plotly's JSON helper; use orjson,
+# which serializes the numpy arrays in the figures directly
+pio.json.config.default_engine = 'orjson'
+
+# Create Dash app with Bootstrap theme (gzip/brotli responses via flask-compress).
+# Component libraries (Plotly.js, React, ...) are loaded from the unpkg CDN
+app = Dash(__name__, external_stylesheets=[dbc.themes.FLATLY], compress=True,
+           serve_locally=False)
 
 # App Layout
 app.layout = dbc.Container([
@@ -32,8 +55,8 @@ app.layout = dbc.Container([
                     html.Label("Select Year", className="fw-bold"),
                     dcc.Dropdown(
                         id='year-dropdown',
-                        options=[{'label': str(year), 'value': year} for year in sorted(df['year'].unique())],
-                        value=df['year'].max(),
+                        options=YEAR_OPTIONS,
+                        value=int(YEARS[-1]),
                         clearable=False,
                         className="mb-3"
                     )
@@ -67,7 +90,7 @@ app.layout = dbc.Container([
                     html.Label("Select State for Trend", className="fw-bold"),
                     dcc.Dropdown(
                         id='state-trend-dropdown',
-                        options=[{'label': state, 'value': state} for state in sorted(df['state'].unique())],
+                        options=STATE_OPTIONS,
                         value='NY',  # Default to New York
                         clearable=False,
                         className="mb-3"
@@ -75,6 +98,9 @@ app.layout = dbc.Container([
                 ], width=12)
             ]),
             
+            # Static per-state series for the clientside trend callback
+            dcc.Store(id='pop-data', data=TREND_DATA),
+            
             # Population Trend Graph
             dbc.Row([
                 dbc.Col([
@@ -85,35 +111,25 @@ app.layout = dbc.Container([
     ]),
 ], fluid=True)
 
-# Callback for Population Map
-@app.callback(
-    Output('state-population-map', 'figure'),
-    [Input('year-dropdown', 'value'),
-     Input('map-type-dropdown', 'value')]
-)
-def update_map(selected_year, map_type):
-    filtered_data = df[df['year'] == selected_year].copy()
-    
+# Population Map figure for one (year, map type) pair
+def build_map_figure(selected_year, map_type):
     if map_type == 'growth':
-        # Calculate growth rate
-        prev_year_data = df[df['year'] == selected_year-1].copy()
-        filtered_data = filtered_data.merge(
-            prev_year_data[['state', 'population']], 
-            on='state', 
-            suffixes=('_current', '_previous')
-        )
-        filtered_data['growth_rate'] = (filtered_data['population_current'] - filtered_data['population_previous']) / filtered_data['population_previous'] * 100
+        values = growth_matrix.loc[selected_year].to_numpy()
         color_column = 'growth_rate'
         title = f'Population Growth Rate {selected_year-1} to {selected_year}'
         color_scale = 'RdYlGn'
     else:
+        values = pop.loc[selected_year].to_numpy(dtype=np.float64, na_value=np.nan)
         color_column = 'population'
         title = f'Total Population in {selected_year}'
         color_scale = 'Plasma'
     
+    # Leave out states with no data for the year
+    has_data = ~np.isnan(values)
+    
     fig = go.Figure(data=go.Choropleth(
-        locations=filtered_data['state'], 
-        z=filtered_data[color_column],
+        locations=pop.columns.to_numpy()[has_data], 
+        z=values[has_data],
         locationmode="USA-states", 
         colorscale=color_scale,
         colorbar_title=color_column
@@ -125,57 +141,29 @@ def update_map(selected_year, map_type):
         height=600,
         title_x=0.5
     )
-    return fig
+    return fig.to_dict()
 
-# Callback for State Population Trend
+# Every (year, map type) pair is known up front, so build all the maps once
+FIGCACHE = {(int(year), map_type): build_map_figure(int(year), map_type)
+            for year in pop.index for map_type in ('total', 'growth')}
+
+# Callback for Population Map
 @app.callback(
+    Output('state-population-map', 'figure'),
+    [Input('year-dropdown', 'value'),
+     Input('map-type-dropdown', 'value')]
+)
+def update_map(selected_year, map_type):
+    return FIGCACHE[(selected_year, map_type)]
+
+# State Population Trend figure is built in the browser (assets/trends.js)
+# from the static data in the 'pop-data' store, skipping the server round-trip
+app.clientside_callback(
+    ClientsideFunction(namespace='trends', function_name='state_population_trend'),
     Output('state-population-trend-graph', 'figure'),
-    [Input('state-trend-dropdown', 'value')]
+    [Input('state-trend-dropdown', 'value')],
+    [State('pop-data', 'data')]
 )
-def update_state_population_trend(selected_state):
-    # Filter data for the selected state
-    state_data = df[df['state'] == selected_state]
-    
-    # Create line plot for the selected state
-    fig = go.Figure()
-    
-    # Add state trend line
-    fig.add_trace(
-        go.Scatter(
-            x=state_data['year'], 
-            y=state_data['population'], 
-            mode='lines+markers', 
-            name=f'{selected_state} Population',
-            line=dict(color='blue', width=3)
-        )
-    )
-    
-    # Calculate and add trend line annotations
-    first_pop = state_data['population'].iloc[0]
-    last_pop = state_data['population'].iloc[-1]
-    total_growth = ((last_pop - first_pop) / first_pop) * 100
-    
-    fig.update_layout(
-        title=f'Population Trend for {selected_state} (Total Growth: {total_growth:.2f}%)',
-        xaxis_title='Year',
-        yaxis_title='Population',
-        height=600,
-        title_x=0.5,
-        annotations=[
-            dict(
-                x=state_data['year'].iloc[-1],
-                y=last_pop,
-                xref="x", yref="y",
-                text=f'Current: {last_pop:,}',
-                showarrow=True,
-                arrowhead=7,
-                ax=0,
-                ay=-40
-            )
-        ]
-    )
-    
-    return fig
 
 # For Render deployment
 server = app.server
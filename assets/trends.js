@@ -0,0 +1,50 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    trends: {
+        state_population_trend: function(selectedState, data) {
+            // Drop the years the state has no data for
+            var years = [];
+            var population = [];
+            data.population[selectedState].forEach(function(value, i) {
+                if (value !== null) {
+                    years.push(data.years[i]);
+                    population.push(value);
+                }
+            });
+
+            // Calculate trend line annotations
+            var firstPop = population[0];
+            var lastPop = population[population.length - 1];
+            var totalGrowth = ((lastPop - firstPop) / firstPop) * 100;
+
+            var layout = Object.assign({}, data.layout, {
+                title: {
+                    text: 'Population Trend for ' + selectedState +
+                          ' (Total Growth: ' + totalGrowth.toFixed(2) + '%)',
+                    x: 0.5
+                },
+                annotations: [{
+                    x: years[years.length - 1],
+                    y: lastPop,
+                    xref: 'x', yref: 'y',
+                    text: 'Current: ' + lastPop.toLocaleString('en-US'),
+                    showarrow: true,
+                    arrowhead: 7,
+                    ax: 0,
+                    ay: -40
+                }]
+            });
+
+            return {
+                data: [{
+                    type: 'scatter',
+                    x: years,
+                    y: population,
+                    mode: 'lines+markers',
+                    name: selectedState + ' Population',
+                    line: {color: 'blue', width: 3}
+                }],
+                layout: layout
+            };
+        }
+    }
+});
@@ -0,0 +1,83 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+DATA_URL = "https://raw.githubusercontent.com/JoshData/historical-state-population-csv/refs/heads/primary/historical_state_population_by_year.csv"
+# Local Parquet copy of the CSV (override the location with USA_POP_CACHE).
+# It lives in the project checkout so a cache warmed at build time ships with
+# the deploy on Render
+CACHE_PATH = os.environ.get(
+    'USA_POP_CACHE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'usa_pop.parquet')
+)
+
+DTYPES = {'state': 'category', 'year': 'int16', 'population': 'int32'}
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _write_cache(df):
+    # Write to a temporary file next to the cache and swap it in, so a crash
+    # or full disk never leaves a partial file at CACHE_PATH
+    cache_dir = os.path.dirname(CACHE_PATH)
+    tmp_path = f'{CACHE_PATH}.{os.getpid()}.tmp'
+    try:
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        # Read-only filesystem: keep serving from memory
+        _remove_quietly(tmp_path)
+
+
+@lru_cache(maxsize=None)
+def load():
+    # Load data (download once, then reuse the Parquet cache on later boots)
+    df = None
+    if os.path.exists(CACHE_PATH):
+        try:
+            df = pd.read_parquet(CACHE_PATH)
+        except (OSError, ValueError):
+            # Damaged cache (e.g. an interrupted write): drop it and download again
+            _remove_quietly(CACHE_PATH)
+    if df is None:
+        df = pd.read_csv(DATA_URL, names=['state', 'year', 'population'],
+                         dtype=DTYPES, engine='pyarrow')
+        _write_cache(df)
+
+    # Narrowest types that hold the data (populations stay below 2**31);
+    # also normalises caches written with wider types
+    df = df.astype(DTYPES)
+
+    # Preprocessing (relabel the categories rather than every row)
+    df['state'] = df['state'].cat.rename_categories(lambda s: s.upper())
+
+    # Year x state population matrix for direct row lookups in the callbacks.
+    # Nullable Int32 keeps the narrow width despite the years some states have
+    # no data for (a plain pivot would widen to float64 to hold the NaNs)
+    pop = df.pivot(index='year', columns='state', values='population').sort_index().astype('Int32')
+    pop.columns = pop.columns.astype(str)
+
+    # Year-over-year growth (%) for every state, computed once in float32.
+    # Rows are filled out to every calendar year first, so neighbouring rows
+    # are always year-1 and year; a year with no previous year stays NaN
+    annual = pop.reindex(range(pop.index.min(), pop.index.max() + 1))
+    values = annual.to_numpy(dtype=np.float32, na_value=np.nan)
+    growth = np.full_like(values, np.nan)
+    np.subtract(values[1:], values[:-1], out=growth[1:])
+    np.divide(growth[1:], values[:-1], out=growth[1:])
+    growth[1:] *= 100
+    growth_matrix = pd.DataFrame(growth, index=annual.index, columns=pop.columns).loc[pop.index]
+
+    return df, pop, growth_matrix
+
+
+df, pop, growth_matrix = load()
@@ -0,0 +1,8 @@
+import gc
+
+
+def when_ready(server):
+    # With --preload the app (data, figures, options) is already built in the
+    # master. Freezing it keeps the workers' garbage collector from writing to
+    # those objects; reference count updates still copy the pages they touch.
+    gc.freeze()